@@ -0,0 +1,22 @@
+"""
+One-off conversion of the trained Keras model to ONNX.
+
+Run once after training (requires tensorflow and tf2onnx):
+    python convert_to_onnx.py
+
+The app automatically uses phishing_model.onnx when it exists,
+which skips the TF/Keras dispatch overhead at prediction time.
+"""
+import os
+
+import tf2onnx
+from tensorflow.keras.models import load_model
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+model = load_model(os.path.join(BASE_DIR, "phishing_model.h5"))
+tf2onnx.convert.from_keras(
+    model, opset=15,
+    output_path=os.path.join(BASE_DIR, "phishing_model.onnx")
+)
+print("Wrote phishing_model.onnx")
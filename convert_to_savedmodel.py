@@ -0,0 +1,19 @@
+"""
+One-off export of the trained Keras model to the TF SavedModel format.
+
+Run once after training (requires tensorflow):
+    python convert_to_savedmodel.py
+
+The legacy HDF5 path reads the entire weight blob through h5py before
+instantiating the model; the app prefers the phishing_model_tf directory
+when it exists.
+"""
+import os
+
+from tensorflow.keras.models import load_model
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+model = load_model(os.path.join(BASE_DIR, "phishing_model.h5"))
+model.save(os.path.join(BASE_DIR, "phishing_model_tf"), save_format="tf")
+print("Wrote phishing_model_tf/")
@@ -0,0 +1,34 @@
+"""
+One-off post-training int8 quantization of the trained Keras model.
+
+Run once after training (requires tensorflow):
+    python convert_to_tflite.py
+
+The app automatically uses phishing_model.tflite when it exists; the
+TFLite interpreter has far lower per-call overhead than the full Keras
+runtime and int8 matmuls cut memory traffic for the tiny MLP.
+"""
+import os
+
+import numpy as np
+import tensorflow as tf
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+model = tf.keras.models.load_model(os.path.join(BASE_DIR, "phishing_model.h5"))
+
+def representative_dataset():
+    # the model sees standardized features, so unit-normal samples
+    # cover the calibration range
+    rng = np.random.default_rng(0)
+    for _ in range(200):
+        yield [rng.standard_normal((1, 13)).astype(np.float32)]
+
+converter = tf.lite.TFLiteConverter.from_keras_model(model)
+converter.optimizations = [tf.lite.Optimize.DEFAULT]
+converter.representative_dataset = representative_dataset
+converter.target_spec.supported_ops = [tf.lite.OpsSet.TFLITE_BUILTINS_INT8]
+
+with open(os.path.join(BASE_DIR, "phishing_model.tflite"), "wb") as f:
+    f.write(converter.convert())
+print("Wrote phishing_model.tflite")
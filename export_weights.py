@@ -0,0 +1,29 @@
+"""
+One-off extraction of the dense-layer weights from phishing_model.h5.
+
+Run once (requires only h5py and numpy, not tensorflow):
+    python export_weights.py
+
+The model is a 13-64-32-1 MLP (relu, relu, sigmoid); dropout layers are
+identity at inference. With weights.npz present the app runs the forward
+pass in pure NumPy and never imports TensorFlow.
+"""
+import os
+
+import h5py
+import numpy as np
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+with h5py.File(os.path.join(BASE_DIR, "phishing_model.h5"), "r") as f:
+    g = f["model_weights"]
+    np.savez(
+        os.path.join(BASE_DIR, "weights.npz"),
+        W1=g["dense"]["dense"]["kernel:0"][()],
+        b1=g["dense"]["dense"]["bias:0"][()],
+        W2=g["dense_1"]["dense_1"]["kernel:0"][()],
+        b2=g["dense_1"]["dense_1"]["bias:0"][()],
+        W3=g["dense_2"]["dense_2"]["kernel:0"][()],
+        b3=g["dense_2"]["dense_2"]["bias:0"][()],
+    )
+print("Wrote weights.npz")
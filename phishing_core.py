@@ -0,0 +1,351 @@
+"""
+Shared model loading, feature extraction, and prediction helpers.
+
+Every UI entry point (app.py) imports from this module, so the model,
+scaler, and compiled matchers are loaded exactly once per process and
+shared across Streamlit sessions via st.cache_resource.
+"""
+import streamlit as st
+import numpy as np
+import joblib
+import os
+import re
+import requests
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+import threading
+from urllib.parse import urlparse
+
+# --------------------------------------------------
+# Load model and scaler (cached once per process)
+# --------------------------------------------------
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+SAVEDMODEL_PATH = os.path.join(BASE_DIR, "phishing_model_tf")
+
+WEIGHTS_PATH = os.path.join(BASE_DIR, "weights.npz")
+
+@st.cache_resource
+def get_weights():
+    """Dense-layer weights for the NumPy forward pass (see export_weights.py)."""
+    if not os.path.exists(WEIGHTS_PATH):
+        return None
+    return np.load(WEIGHTS_PATH)
+
+def _forward(w, x):
+    """The whole 13-64-32-1 MLP: two relu layers and a sigmoid output."""
+    h = np.maximum(x @ w["W1"] + w["b1"], 0.0)
+    h = np.maximum(h @ w["W2"] + w["b2"], 0.0)
+    z = h @ w["W3"] + w["b3"]
+    return 1.0 / (1.0 + np.exp(-z))
+
+@st.cache_resource
+def get_model():
+    # prefer the SavedModel export; the legacy HDF5 path reads the whole
+    # weight blob through h5py before instantiating the model
+    from tensorflow.keras.models import load_model
+    if os.path.isdir(SAVEDMODEL_PATH):
+        model = load_model(SAVEDMODEL_PATH)
+    else:
+        model = load_model(os.path.join(BASE_DIR, "phishing_model.h5"))
+    # warm-up call: pay the one-time graph tracing cost at load instead of
+    # on the first user click
+    model(np.zeros((1, 13), dtype=np.float32), training=False)
+    return model
+
+@st.cache_resource
+def get_scaler():
+    return joblib.load(os.path.join(BASE_DIR, "scaler.pkl"))
+
+# StandardScaler parameters frozen as module constants so the hot path
+# does no attribute or cache lookups
+_MEAN = np.ascontiguousarray(get_scaler().mean_, dtype=np.float32)
+_INV_SCALE = np.ascontiguousarray(1.0 / get_scaler().scale_, dtype=np.float32)
+
+def scale_features(features_array):
+    """(x - _MEAN) * _INV_SCALE, skipping sklearn's per-call validation.
+
+    The output buffer lives in _SCRATCH (see features_to_array) so
+    concurrent sessions never alias each other's scaled vectors.
+    """
+    out = getattr(_SCRATCH, "scaled", None)
+    if out is None:
+        out = _SCRATCH.scaled = np.empty((1, 13), dtype=np.float32)
+    np.subtract(features_array, _MEAN, out=out)
+    np.multiply(out, _INV_SCALE, out=out)
+    return out
+
+ONNX_PATH = os.path.join(BASE_DIR, "phishing_model.onnx")
+TFLITE_PATH = os.path.join(BASE_DIR, "phishing_model.tflite")
+
+@st.cache_resource
+def get_session():
+    """ONNX Runtime session, or None if the model has not been converted yet."""
+    if not os.path.exists(ONNX_PATH):
+        return None
+    import onnxruntime as ort
+    return ort.InferenceSession(ONNX_PATH, providers=["CPUExecutionProvider"])
+
+@st.cache_resource
+def get_tflite_interpreter():
+    """Quantized TFLite interpreter, or None if the model has not been converted yet."""
+    if not os.path.exists(TFLITE_PATH):
+        return None
+    import tensorflow as tf
+    interp = tf.lite.Interpreter(model_path=TFLITE_PATH)
+    interp.allocate_tensors()
+    return interp
+
+# Optional remote model server (TF Serving REST API), e.g.
+# MODEL_SERVER_URL=http://localhost:8501/v1/models/phishing:predict
+# Lets inference scale independently of the Streamlit replicas; unset,
+# predictions stay in-process.
+MODEL_SERVER_URL = os.environ.get("MODEL_SERVER_URL")
+
+def _predict_remote(scaled):
+    resp = get_http_session().post(
+        MODEL_SERVER_URL, json={"instances": scaled.tolist()}, timeout=5
+    )
+    resp.raise_for_status()
+    return np.asarray(resp.json()["predictions"], dtype=np.float32)
+
+def predict_probability(features_scaled):
+    """Phishing probability for a (1, 13) scaled feature array."""
+    x = features_scaled.astype(np.float32)
+    if MODEL_SERVER_URL:
+        return float(_predict_remote(x).ravel()[0])
+    w = get_weights()
+    if w is not None:
+        return float(_forward(w, x)[0, 0])
+    interp = get_tflite_interpreter()
+    if interp is not None:
+        interp.set_tensor(interp.get_input_details()[0]["index"], x)
+        interp.invoke()
+        return float(interp.get_tensor(interp.get_output_details()[0]["index"])[0, 0])
+    sess = get_session()
+    if sess is not None:
+        return float(sess.run(None, {sess.get_inputs()[0].name: x})[0][0, 0])
+    # direct __call__ skips predict()'s tf.data iterator and callback setup
+    return float(get_model()(x, training=False)[0, 0])
+
+def predict_many(urls):
+    """Phishing probabilities for a list of URLs in one batched model call."""
+    feats = np.array([extract_features(u) for u in urls], dtype=np.float32)
+    scaled = (feats - _MEAN) * _INV_SCALE
+    if MODEL_SERVER_URL:
+        return _predict_remote(scaled).ravel()
+    w = get_weights()
+    if w is not None:
+        return _forward(w, scaled).ravel()
+    sess = get_session()
+    if sess is not None:
+        return sess.run(None, {sess.get_inputs()[0].name: scaled})[0].ravel()
+    # direct __call__ skips the per-batch predict() dispatch overhead
+    return get_model()(scaled, training=False).numpy().ravel()
+
+# --------------------------------------------------
+# Optional reachability check (network, off by default)
+# --------------------------------------------------
+@st.cache_resource
+def get_http_session():
+    """Shared requests.Session so repeat checks reuse the TCP/TLS connection."""
+    return requests.Session()
+
+@st.cache_resource
+def get_executor():
+    """Background executor so the network check overlaps model inference."""
+    return ThreadPoolExecutor(max_workers=2)
+
+@lru_cache(maxsize=256)
+def is_reachable(url):
+    """Whether the URL responds; cached so repeat clicks skip the network."""
+    try:
+        resp = get_http_session().head(url, timeout=3, allow_redirects=True)
+        return resp.status_code < 400
+    except requests.RequestException:
+        return False
+
+# --------------------------------------------------
+# Trusted domains (whitelist)
+# --------------------------------------------------
+TRUSTED_DOMAINS = [
+    "google.com", "youtube.com", "amazon.com", "wikipedia.org",
+    "github.com", "streamlit.io", "microsoft.com",
+    "apple.com", "linkedin.com"
+]
+TRUSTED_SET = frozenset(TRUSTED_DOMAINS)
+
+# --------------------------------------------------
+# Known platform domains
+# --------------------------------------------------
+PLATFORM_DOMAINS = [
+    "youtube.com", "github.com", "twitter.com",
+    "facebook.com", "instagram.com", "netflix.com"
+]
+PLATFORM_SET = frozenset(PLATFORM_DOMAINS)
+
+def _label_suffixes(domain):
+    """All label suffixes of a host, e.g. mail.google.com -> mail.google.com, google.com, com."""
+    host = domain.rpartition(":")[0] or domain  # netloc may carry an explicit port
+    parts = host.split(".")
+    return [".".join(parts[i:]) for i in range(len(parts))]
+
+def is_trusted_domain(domain):
+    """Exact label-suffix match: matches www.google.com but not google.com.evil.ru."""
+    return any(s in TRUSTED_SET for s in _label_suffixes(domain))
+
+def is_platform_domain(domain):
+    return any(s in PLATFORM_SET for s in _label_suffixes(domain))
+
+# --------------------------------------------------
+# FUTURE SCOPE FEATURE 1: Simulated Blacklist (PhishTank-like)
+# --------------------------------------------------
+LOCAL_PHISHING_BLACKLIST = [
+    "secure-login-paypal-update.com",
+    "bank-verification-alert-login.com",
+    "account-security-check-now.com"
+]
+BLACKLIST_RE = re.compile("|".join(map(re.escape, LOCAL_PHISHING_BLACKLIST)))
+
+# --------------------------------------------------
+# FUTURE SCOPE FEATURE 2: Simulated Domain Age Check (WHOIS-like)
+# --------------------------------------------------
+def is_new_domain(domain):
+    """
+    Simulated domain age check.
+    In real systems, WHOIS APIs would be used.
+    """
+    suspicious_keywords = ["secure", "login", "verify", "update"]
+    return any(k in domain for k in suspicious_keywords)
+
+# --------------------------------------------------
+# Risk level function (Binary for campus)
+# --------------------------------------------------
+def get_risk_level(prob):
+    return "HIGH RISK" if prob >= 0.5 else "LOW RISK"
+
+# --------------------------------------------------
+# Feature extraction
+# --------------------------------------------------
+@lru_cache(maxsize=1024)
+def parse_url(url):
+    """urlparse memoized per URL (the same URL is parsed in several places)."""
+    return urlparse(url)
+
+SENSITIVE_WORDS = ["login", "verify", "bank", "secure", "account", "update"]
+
+# Every keyword literal counted by extract_features, sensitive words first
+_URL_KEYWORDS = SENSITIVE_WORDS + ["and", "or", "www", ".com"]
+
+# Single-pass multi-pattern matcher over all ten keywords
+# (falls back to per-word counts if pyahocorasick is unavailable)
+try:
+    import ahocorasick
+    _KEYWORD_AUTOMATON = ahocorasick.Automaton()
+    for _i, _w in enumerate(_URL_KEYWORDS):
+        _KEYWORD_AUTOMATON.add_word(_w, (_i, len(_w)))
+    _KEYWORD_AUTOMATON.make_automaton()
+except ImportError:
+    _KEYWORD_AUTOMATON = None
+
+def count_keywords(ul):
+    """Non-overlapping count of each _URL_KEYWORDS entry in one scan."""
+    if _KEYWORD_AUTOMATON is None:
+        return [ul.count(w) for w in _URL_KEYWORDS]
+    counts = [0] * len(_URL_KEYWORDS)
+    last_end = [-1] * len(_URL_KEYWORDS)
+    for end, (i, n) in _KEYWORD_AUTOMATON.iter(ul):
+        if end - n >= last_end[i]:  # skip overlaps, matching str.count
+            counts[i] += 1
+            last_end[i] = end
+    return counts
+
+# Per-thread scratch buffers: Streamlit runs each session's script in its
+# own thread, so a module-level buffer would race across concurrent sessions
+_SCRATCH = threading.local()
+
+def features_to_array(features):
+    """Pack a 13-element feature list into a reusable per-thread (1, 13) float32 buffer."""
+    buf = getattr(_SCRATCH, "features", None)
+    if buf is None:
+        buf = _SCRATCH.features = np.empty((1, 13), dtype=np.float32)
+    buf[0, :] = features
+    return buf
+
+# The character/keyword counting core, JIT-compiled to native code when
+# numba is available (unicode str.count runs in nopython mode); urlparse
+# stays outside since numba does not support it
+try:
+    import numba
+
+    @numba.njit(cache=True)
+    def _extract_counts(url, ul):
+        sensitive_words_count = (
+            ul.count("login") + ul.count("verify") + ul.count("bank")
+            + ul.count("secure") + ul.count("account") + ul.count("update")
+        )
+        return (
+            len(url),
+            1 if url.startswith("http") else 0,
+            1 if "@" in url else 0,
+            sensitive_words_count,
+            url.count("."),
+            url.count("-"),
+            ul.count("and"),
+            ul.count("or"),
+            ul.count("www"),
+            ul.count(".com"),
+            url.count("_"),
+        )
+except ImportError:
+    _DOT, _HYPHEN, _UNDERSCORE = ord("."), ord("-"), ord("_")
+
+    def _extract_counts(url, ul):
+        # vectorized byte compares for the single-character counts instead
+        # of three separate str.count scans; one automaton pass for all
+        # keyword counts
+        arr = np.frombuffer(url.encode("ascii", "ignore"), dtype=np.uint8)
+        keywords = count_keywords(ul)
+        return (
+            len(url),
+            1 if url.startswith("http") else 0,
+            1 if "@" in url else 0,
+            sum(keywords[:len(SENSITIVE_WORDS)]),
+            int(np.count_nonzero(arr == _DOT)),
+            int(np.count_nonzero(arr == _HYPHEN)),
+            keywords[-4],
+            keywords[-3],
+            keywords[-2],
+            keywords[-1],
+            int(np.count_nonzero(arr == _UNDERSCORE)),
+        )
+
+def extract_features(url, parsed=None):
+    if parsed is None:
+        parsed = parse_url(url)
+    ul = url.lower()  # lowercase once instead of per-count
+
+    (url_length, valid_url, at_symbol, sensitive_words_count,
+     nb_dots, nb_hyphens, nb_and, nb_or, nb_www, nb_com,
+     nb_underscore) = _extract_counts(url, ul)
+
+    path_length = len(parsed.path)
+    isHttps = 1 if parsed.scheme == "https" else 0
+
+    return [
+        url_length, valid_url, at_symbol, sensitive_words_count,
+        path_length, isHttps, nb_dots, nb_hyphens,
+        nb_and, nb_or, nb_www, nb_com, nb_underscore
+    ]
+
+@st.cache_data(max_entries=1024)
+def extract_and_scale(url):
+    """Raw feature list and scaled (1, 13) array for a URL, memoized per URL.
+
+    A repeat Predict click on the same URL becomes a cache lookup plus one
+    model call.
+    """
+    features = extract_features(url)
+    scaled = scale_features(features_to_array(features))
+    # copy: the scratch buffers are shared across calls
+    return features, scaled.copy()
+